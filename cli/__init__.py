@@ -68,6 +68,7 @@ from .messages import (
 from .output import (
     TerminalOutputFormatter,
     echo,
+    echo_batch,
     progress_bar,
     style,
     table,
@@ -136,6 +137,7 @@ __all__ = [
     "MessageError",
     "TerminalOutputFormatter",
     "echo",
+    "echo_batch",
     "style",
     "progress_bar",
     "table",
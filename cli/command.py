@@ -311,6 +311,13 @@ class _SilentArgumentParser(argparse.ArgumentParser):
         raise _ArgparseError(message or f"argparse exit status={status}")
 
 
+class _DictNamespace(argparse.Namespace):
+    """Namespace whose attributes live directly in a caller-supplied dict."""
+
+    def __init__(self, target: dict[str, Any]) -> None:
+        self.__dict__ = target
+
+
 _TRUE_LITERALS = frozenset({"true", "t", "yes", "y", "1", "on"})
 _FALSE_LITERALS = frozenset({"false", "f", "no", "n", "0", "off"})
 
@@ -356,23 +363,18 @@ class EnhancedArgumentParser(ArgumentParser):
             return result
 
         try:
-            parsed_args = parser.parse_args(remaining_args)
+            parser.parse_args(remaining_args, namespace=_DictNamespace(result))
         except _ArgparseError as exc:
             ns = self._partial_parse(parser, remaining_args)
             if ns is not None and getattr(ns, "_cli_help", False):
-                result["_cli_show_help"] = True
-                return result
+                return {"command": command, "_cli_show_help": True}
             raise ValueError(
                 f"Invalid arguments for command '{command}': {exc}.\n"
                 f"Use '{command} --help' for detailed help."
             )
 
-        if getattr(parsed_args, "_cli_help", False):
-            result["_cli_show_help"] = True
-            return result
-
-        result.update(vars(parsed_args))
-        result.pop("_cli_help", None)
+        if result.pop("_cli_help", False):
+            return {"command": command, "_cli_show_help": True}
 
         for opt_meta in command_meta.get("options", []):
             factory = opt_meta.get("default_factory")
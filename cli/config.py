@@ -5,15 +5,17 @@ Configuration management with cross-platform file locking.
 from __future__ import annotations
 
 import copy
+import functools
+import hashlib
 import json
 import logging
 import os
 import platform
+import random
 import re
-import tempfile
 import threading
 import time
-from typing import Any, Pattern
+from typing import Any, Callable, Iterator, Pattern
 
 from .interfaces import ConfigProvider
 
@@ -24,14 +26,27 @@ try:
 except ImportError:
     JSONSCHEMA_AVAILABLE = False
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 if platform.system() == "Windows":
+    import ctypes
     import msvcrt
 
     LOCK_METHOD = "windows"
+    _KERNEL32: Any = ctypes.windll.kernel32
 else:
     import fcntl
 
     LOCK_METHOD = "posix"
+    _KERNEL32 = None
+
+_STALE_CHECK_INTERVAL: float = 1.0
+_MIN_LOCK_BACKOFF: float = 0.001
 
 SENSITIVE_KEY_PATTERNS: frozenset[Pattern[str]] = frozenset(
     {
@@ -67,14 +82,37 @@ class ConfigLockError(ConfigError):
     """Failed to acquire configuration file lock."""
 
 
+_PID: int = os.getpid()
+_UID: int = os.getuid() if hasattr(os, "getuid") else 0
+
+
+def _refresh_pid() -> None:
+    global _PID
+    _PID = os.getpid()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_refresh_pid)
+
+
+def _lock_backoff(max_delay: float) -> Iterator[float]:
+    """Yield jittered retry delays doubling from 1ms up to max_delay."""
+    delay = _MIN_LOCK_BACKOFF
+    while True:
+        yield delay * (0.5 + random.random())
+        delay = min(delay * 2, max_delay)
+
+
 class FileLock:
     """
     Cross-platform file locking with timeout and stale detection.
 
-    Note: PID-based stale detection cannot fully prevent PID-reuse races.
-    The fcntl/msvcrt advisory lock is the actual mutual-exclusion mechanism;
-    stale-detection only optimizes cleanup of crashed processes.
-    On Windows, the lock applies to the .lock sidecar file.
+    On POSIX the lock is an fcntl.flock on a persistent .lock sidecar. The
+    kernel drops it when the holder exits, so the sidecar is never removed
+    and no stale detection is needed; waiters retry LOCK_NB with backoff.
+    On Windows, the .lock sidecar doubles as a sentinel guarded by msvcrt;
+    PID-based stale detection cleans up after crashed processes but cannot
+    fully prevent PID-reuse races.
     """
 
     def __init__(
@@ -92,11 +130,9 @@ class FileLock:
         self._logger: logging.Logger = logging.getLogger(
             "cliframework.config.lock"
         )
-        self._pid: int = os.getpid()
-        try:
-            self._uid: int = os.getuid()
-        except AttributeError:
-            self._uid = 0
+        self._pid: int = _PID
+        self._uid: int = _UID
+        self._observed_lock: tuple[tuple[int, int], int] | None = None
 
     def __enter__(self) -> FileLock:
         if not self.acquire():
@@ -111,74 +147,124 @@ class FileLock:
     def acquire(self, poll_interval: float = 0.1) -> bool:
         if self.is_locked:
             return True
+        max_delay = max(
+            _MIN_LOCK_BACKOFF, min(poll_interval, self.timeout / 10)
+        )
+        if LOCK_METHOD == "posix":
+            return self._acquire_posix(max_delay)
+        return self._acquire_windows(max_delay)
+
+    def _acquire_posix(self, max_delay: float) -> bool:
+        deadline = time.monotonic() + self.timeout
+        try:
+            os.makedirs(os.path.dirname(self.lock_path) or ".", exist_ok=True)
+            fd = os.open(self.lock_path, os.O_CREAT | os.O_RDWR, 0o600)
+        except OSError as exc:
+            self._logger.error(f"Failed to acquire lock: {exc}")
+            raise ConfigLockError(f"Failed to acquire lock: {exc}")
+
+        try:
+            acquired = self._flock_until(fd, deadline, max_delay)
+        except Exception as exc:
+            os.close(fd)
+            self._logger.error(f"Failed to acquire lock: {exc}")
+            raise ConfigLockError(f"Failed to acquire lock: {exc}")
+
+        if not acquired:
+            os.close(fd)
+            return False
+        self.lock_file = os.fdopen(fd, "r+")
+        self.is_locked = True
+        return True
+
+    @staticmethod
+    def _flock_until(fd: int, deadline: float, max_delay: float) -> bool:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return True
+        except BlockingIOError:
+            pass
 
-        start_time = time.time()
+        delays = _lock_backoff(max_delay)
+        while time.monotonic() < deadline:
+            remaining = max(0.0, deadline - time.monotonic())
+            time.sleep(min(next(delays), remaining))
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                return True
+            except BlockingIOError:
+                continue
+        return False
+
+    def _acquire_windows(self, max_delay: float) -> bool:
+        deadline = time.monotonic() + self.timeout
+        delays = _lock_backoff(max_delay)
         lock_file_created_by_us = False
+        last_stale_check = float("-inf")
+
+        def stale_check_due() -> bool:
+            nonlocal last_stale_check
+            now = time.monotonic()
+            if now - last_stale_check < _STALE_CHECK_INTERVAL:
+                return False
+            last_stale_check = now
+            return True
 
-        while time.time() - start_time < self.timeout:
+        try:
+            os.makedirs(os.path.dirname(self.lock_path) or ".", exist_ok=True)
+        except OSError as exc:
+            self._logger.error(f"Failed to acquire lock: {exc}")
+            raise ConfigLockError(f"Failed to acquire lock: {exc}")
+
+        while time.monotonic() < deadline:
             try:
-                os.makedirs(
-                    os.path.dirname(self.lock_path) or ".", exist_ok=True
-                )
+                try:
+                    lock_stat: os.stat_result | None = os.stat(self.lock_path)
+                except FileNotFoundError:
+                    lock_stat = None
 
-                if os.path.exists(self.lock_path):
-                    if self._is_stale_lock():
+                if lock_stat is not None:
+                    if stale_check_due() and self._is_stale_lock(lock_stat):
                         self._safe_remove_lock_file()
                     else:
-                        time.sleep(poll_interval)
+                        time.sleep(next(delays))
                         continue
 
                 try:
                     fd = os.open(
                         self.lock_path,
-                        os.O_CREAT | os.O_EXCL | os.O_WRONLY,
+                        os.O_CREAT | os.O_EXCL | os.O_RDWR,
                         0o600,
                     )
-                    os.write(fd, f"{self._pid}:{self._uid}\n".encode("utf-8"))
-                    os.close(fd)
                     lock_file_created_by_us = True
                 except FileExistsError:
-                    if self._is_stale_lock():
+                    if stale_check_due() and self._is_stale_lock():
                         self._safe_remove_lock_file()
                         continue
-                    time.sleep(poll_interval)
+                    time.sleep(next(delays))
                     continue
 
-                self.lock_file = open(self.lock_path, "r+")
+                self.lock_file = os.fdopen(fd, "r+")
+                os.write(fd, f"{self._pid}:{self._uid}\n".encode("utf-8"))
+                # msvcrt.locking() locks from the current offset.
+                os.lseek(fd, 0, os.SEEK_SET)
 
-                if LOCK_METHOD == "windows":
-                    try:
-                        msvcrt.locking(
-                            self.lock_file.fileno(),
-                            msvcrt.LK_NBLCK,
-                            0x7FFF0000,
-                        )
-                        self.is_locked = True
-                        return True
-                    except (IOError, OSError):
-                        self.lock_file.close()
-                        self.lock_file = None
-                        if lock_file_created_by_us:
-                            self._safe_remove_lock_file()
-                            lock_file_created_by_us = False
-                        time.sleep(poll_interval)
-                        continue
-                else:
-                    try:
-                        fcntl.flock(
-                            self.lock_file.fileno(),
-                            fcntl.LOCK_EX | fcntl.LOCK_NB,
-                        )
-                        self.is_locked = True
-                        return True
-                    except (IOError, BlockingIOError, OSError):
-                        self.lock_file.close()
-                        self.lock_file = None
-                        if lock_file_created_by_us:
-                            self._safe_remove_lock_file()
-                            lock_file_created_by_us = False
-                        time.sleep(poll_interval)
-                        continue
+                try:
+                    msvcrt.locking(
+                        self.lock_file.fileno(),
+                        msvcrt.LK_NBLCK,
+                        0x7FFF0000,
+                    )
+                    self.is_locked = True
+                    return True
+                except (IOError, OSError):
+                    self.lock_file.close()
+                    self.lock_file = None
+                    if lock_file_created_by_us:
+                        self._safe_remove_lock_file()
+                        lock_file_created_by_us = False
+                    time.sleep(next(delays))
+                    continue
 
             except Exception as exc:
                 if self.lock_file:
@@ -222,64 +308,59 @@ class FileLock:
                 except (OSError, IOError):
                     pass
                 self.lock_file = None
-            self._safe_remove_lock_file()
+            # The POSIX sidecar must stay: unlinking it would let a waiter
+            # holding the old inode and a newcomer on a fresh one both "win".
+            if LOCK_METHOD == "windows":
+                self._safe_remove_lock_file()
             self.is_locked = False
 
-    def _is_stale_lock(self) -> bool:
+    def _is_stale_lock(self, lock_stat: os.stat_result | None = None) -> bool:
+        # Only the Windows sentinel can go stale; a POSIX flock dies with
+        # its holder, and the config file itself is never locked directly
+        # because os.replace() swaps its inode on every save.
         try:
-            if not os.path.exists(self.lock_path):
-                return False
-            mtime = os.path.getmtime(self.lock_path)
-            if time.time() - mtime <= self.stale_timeout:
+            if lock_stat is None:
+                try:
+                    lock_stat = os.stat(self.lock_path)
+                except FileNotFoundError:
+                    return False
+            age_ns = time.time_ns() - lock_stat.st_mtime_ns
+            if age_ns <= self.stale_timeout * 1e9:
                 return False
 
+            identity = (lock_stat.st_ino, lock_stat.st_mtime_ns)
+            if self._observed_lock is not None and (
+                self._observed_lock[0] == identity
+            ):
+                return self._is_windows_pid_dead(self._observed_lock[1])
+
             try:
                 with open(self.lock_path, "r") as f:
                     lock_info = f.read().strip()
-                if ":" in lock_info:
-                    old_pid_str, old_uid_str = lock_info.split(":", 1)
-                else:
-                    old_pid_str, old_uid_str = lock_info, "0"
-
+                old_pid_str = lock_info.split(":", 1)[0]
                 if not old_pid_str.isdigit():
                     return True
                 old_pid = int(old_pid_str)
-
-                if platform.system() == "Windows":
-                    return self._is_windows_pid_dead(old_pid)
-                return self._is_posix_pid_dead(old_pid, old_uid_str)
             except (OSError, IOError, ValueError):
                 return True
+            self._observed_lock = (identity, old_pid)
+            return self._is_windows_pid_dead(old_pid)
         except (OSError, IOError):
             return False
 
     def _is_windows_pid_dead(self, old_pid: int) -> bool:
         try:
-            import ctypes
-
-            kernel32 = ctypes.windll.kernel32
-            handle = kernel32.OpenProcess(0x1000, False, old_pid)
+            handle = _KERNEL32.OpenProcess(0x1000, False, old_pid)
             if not handle:
                 error = ctypes.get_last_error()
                 if error == 5:
                     return False
                 return True
-            kernel32.CloseHandle(handle)
+            _KERNEL32.CloseHandle(handle)
             return False
         except Exception:
             return False
 
-    def _is_posix_pid_dead(self, old_pid: int, old_uid_str: str) -> bool:
-        try:
-            os.kill(old_pid, 0)
-            if old_uid_str.isdigit() and int(old_uid_str) != self._uid:
-                return False
-            return False
-        except (OSError, ProcessLookupError):
-            if old_uid_str.isdigit() and int(old_uid_str) != self._uid:
-                return False
-            return True
-
     def _safe_remove_lock_file(self) -> None:
         try:
             if os.path.exists(self.lock_path):
@@ -288,6 +369,56 @@ class FileLock:
             pass
 
 
+_SCOPED_FLAGS: tuple[tuple[int, str], ...] = (
+    (re.IGNORECASE, "i"),
+    (re.MULTILINE, "m"),
+    (re.DOTALL, "s"),
+    (re.VERBOSE, "x"),
+)
+
+
+def _scoped_pattern(pattern: Pattern[str]) -> str:
+    flags = "".join(c for flag, c in _SCOPED_FLAGS if pattern.flags & flag)
+    return f"(?{flags}:{pattern.pattern})" if flags else f"(?:{pattern.pattern})"
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_sensitive_matcher(
+    patterns: frozenset[Pattern[str]],
+) -> Callable[[str], bool]:
+    """
+    Fold key patterns into one alternation and memoise verdicts per key.
+
+    The ``^.*suffix$`` patterns backtrack across the whole key for every
+    alternative, while config trees repeat the same key names constantly.
+    Patterns with capture groups are matched on their own, since the
+    alternation would renumber the groups their backreferences point at.
+    """
+    plain = [p for p in patterns if p.groups == 0]
+    matchers = [p.match for p in patterns if p.groups]
+    if plain:
+        try:
+            matchers.append(
+                re.compile("|".join(_scoped_pattern(p) for p in plain)).match
+            )
+        except re.error:
+            matchers.extend(p.match for p in plain)
+
+    @functools.lru_cache(maxsize=4096)
+    def is_sensitive(key: str) -> bool:
+        return any(match(key) is not None for match in matchers)
+
+    return is_sensitive
+
+
+def _redact(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {k: "***REDACTED***" for k in value}
+    if isinstance(value, list):
+        return ["***REDACTED***"] * len(value)
+    return "***REDACTED***"
+
+
 def sanitize_for_logging(
     data: dict[str, Any],
     sensitive_patterns: set[Pattern[str]] | None = None,
@@ -296,38 +427,129 @@ def sanitize_for_logging(
     patterns = SENSITIVE_KEY_PATTERNS
     if sensitive_patterns:
         patterns = patterns | frozenset(sensitive_patterns)
+    is_sensitive = _compile_sensitive_matcher(patterns)
+
+    result: dict[str, Any] = {}
+    stack: list[tuple[Any, Any]] = [(data, result)]
+    while stack:
+        src, dst = stack.pop()
+        if isinstance(src, dict):
+            for k, v in src.items():
+                if is_sensitive(k):
+                    dst[k] = _redact(v)
+                elif isinstance(v, dict):
+                    dst[k] = node = {}
+                    stack.append((v, node))
+                elif isinstance(v, list):
+                    dst[k] = node = []
+                    stack.append((v, node))
+                else:
+                    dst[k] = v
+        else:
+            for item in src:
+                if isinstance(item, dict):
+                    node = {}
+                    stack.append((item, node))
+                elif isinstance(item, list):
+                    node = []
+                    stack.append((item, node))
+                else:
+                    node = item
+                dst.append(node)
+    return result
 
-    def is_sensitive(key: str) -> bool:
-        return any(p.match(key) for p in patterns)
-
-    def sanitize(value: Any, parent_is_sensitive: bool) -> Any:
-        if parent_is_sensitive:
-            if isinstance(value, dict):
-                return {k: "***REDACTED***" for k in value}
-            if isinstance(value, list):
-                return ["***REDACTED***"] * len(value)
-            return "***REDACTED***"
-        if isinstance(value, dict):
-            return {
-                k: (
-                    "***REDACTED***"
-                    if is_sensitive(k) and not isinstance(v, (dict, list))
-                    else sanitize(v, is_sensitive(k))
-                )
-                for k, v in value.items()
-            }
-        if isinstance(value, list):
-            return [sanitize(item, False) for item in value]
-        return value
 
-    return {
-        k: (
-            "***REDACTED***"
-            if is_sensitive(k) and not isinstance(v, (dict, list))
-            else sanitize(v, is_sensitive(k))
-        )
-        for k, v in data.items()
-    }
+# orjson turns integers outside the 64-bit range into floats; payloads that
+# might hold one (any run of 19+ digits) go through json, which keeps them exact.
+_WIDE_NUMBER = re.compile(rb"\d{19}")
+
+
+def _loads(raw: bytes) -> Any:
+    if ORJSON_AVAILABLE and _WIDE_NUMBER.search(raw) is None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # orjson rejects the NaN/Infinity literals json.dumps() writes.
+            pass
+    return json.loads(raw.decode("utf-8"))
+
+
+_PARSE_CACHE: dict[str, tuple[tuple[int, int, int, int], Any]] = {}
+_PARSE_CACHE_LOCK = threading.Lock()
+
+
+def _read_config(path: str) -> tuple[tuple[int, int, int, int], Any]:
+    """
+    Parse the file at path, reusing the previous parse while it is unchanged.
+
+    Returns the file's (st_dev, st_ino, st_mtime_ns, st_size) stamp with the
+    tree. The tree may be shared with other providers and must not be mutated.
+    """
+    with open(path, "rb", buffering=0) as f:
+        st = os.fstat(f.fileno())
+        stamp = (st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size)
+        with _PARSE_CACHE_LOCK:
+            cached = _PARSE_CACHE.get(path)
+        if cached is not None and cached[0] == stamp:
+            return cached
+        loaded = _loads(f.read())
+    with _PARSE_CACHE_LOCK:
+        _PARSE_CACHE[path] = (stamp, loaded)
+    return stamp, loaded
+
+
+def _forget_parsed(path: str) -> None:
+    with _PARSE_CACHE_LOCK:
+        _PARSE_CACHE.pop(path, None)
+
+
+def _has_non_finite(value: Any) -> bool:
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, float):
+            if item != item or item in (float("inf"), float("-inf")):
+                return True
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return False
+
+
+def _dumps(config: dict[str, Any]) -> bytes:
+    """Serialize as sorted, 2-space indented UTF-8 JSON."""
+    if ORJSON_AVAILABLE:
+        try:
+            payload = orjson.dumps(
+                config,
+                option=orjson.OPT_INDENT_2
+                | orjson.OPT_SORT_KEYS
+                | orjson.OPT_NON_STR_KEYS,
+            )
+        except TypeError:
+            pass
+        else:
+            # orjson writes NaN/inf as null; let json keep them as it always has.
+            if b"null" not in payload or not _has_non_finite(config):
+                return payload
+    return json.dumps(
+        config, indent=2, ensure_ascii=False, sort_keys=True
+    ).encode("utf-8")
+
+
+_IMMUTABLE_SCALARS: tuple[type, ...] = (str, int, float, bool, type(None))
+
+
+def _clone(value: Any) -> Any:
+    """Deep-copy JSON-shaped data without deepcopy's memo bookkeeping."""
+    if isinstance(value, _IMMUTABLE_SCALARS):
+        return value
+    if type(value) is dict:
+        return {k: _clone(v) for k, v in value.items()}
+    if type(value) is list:
+        return [_clone(v) for v in value]
+    return copy.deepcopy(value)
 
 
 def deep_merge(
@@ -342,35 +564,66 @@ def deep_merge(
         - "prefer_base": preserve base type when types differ (safer for defaults)
         - "prefer_updates": legacy behavior, updates win
     """
-    result = copy.deepcopy(base)
+    return _merge_into(_clone(base), updates, on_type_conflict)
+
+
+def _merge_into(
+    result: dict[str, Any],
+    updates: dict[str, Any],
+    on_type_conflict: str = "prefer_base",
+) -> dict[str, Any]:
+    """deep_merge() without the up-front copy; mutates and returns result."""
     logger = logging.getLogger("cliframework.config.merge")
 
-    for key, value in updates.items():
-        if (
-            key in result
-            and isinstance(result[key], dict)
-            and isinstance(value, dict)
-        ):
-            result[key] = deep_merge(result[key], value, on_type_conflict)
-        elif (
-            key in result
-            and type(result[key]) is not type(value)
-            and result[key] is not None
-            and value is not None
-        ):
-            if on_type_conflict == "prefer_base":
-                logger.warning(
-                    f"Type mismatch at key '{key}': base={type(result[key]).__name__}, "
-                    f"updates={type(value).__name__}; preserving base"
-                )
+    stack: list[tuple[dict[str, Any], dict[str, Any]]] = [(result, updates)]
+    while stack:
+        dst, src = stack.pop()
+        for key, value in src.items():
+            if key not in dst:
+                dst[key] = _clone(value)
+                continue
+            current = dst[key]
+            if isinstance(current, dict) and isinstance(value, dict):
+                stack.append((current, value))
+            elif (
+                type(current) is not type(value)
+                and current is not None
+                and value is not None
+            ):
+                if on_type_conflict == "prefer_base":
+                    logger.warning(
+                        f"Type mismatch at key '{key}': base={type(current).__name__}, "
+                        f"updates={type(value).__name__}; preserving base"
+                    )
+                else:
+                    dst[key] = _clone(value)
             else:
-                result[key] = copy.deepcopy(value)
-        else:
-            result[key] = copy.deepcopy(value)
+                dst[key] = _clone(value)
 
     return result
 
 
+def _flatten(tree: dict[str, Any]) -> dict[str, Any]:
+    """Index non-dict leaves by dotted path; dotted key names stay unindexed."""
+    flat: dict[str, Any] = {}
+    stack: list[tuple[str, dict[str, Any]]] = [("", tree)]
+    while stack:
+        prefix, node = stack.pop()
+        for k, v in node.items():
+            if not isinstance(k, str) or "." in k:
+                continue
+            if isinstance(v, dict):
+                stack.append((f"{prefix}{k}.", v))
+            else:
+                flat[prefix + k] = v
+    return flat
+
+
+@functools.lru_cache(maxsize=1024)
+def _split_key(key: str) -> tuple[str, ...]:
+    return tuple(key.split("."))
+
+
 class JsonConfigProvider(ConfigProvider):
     """JSON-based configuration provider with file locking and schema validation."""
 
@@ -381,18 +634,39 @@ class JsonConfigProvider(ConfigProvider):
         schema: dict[str, Any] | None = None,
         lock_timeout: float = 10.0,
         stale_lock_timeout: float = 300.0,
+        durable: bool = True,
     ) -> None:
         self._config_path: str = os.path.abspath(
             os.path.expanduser(config_path)
         )
         self._config: dict[str, Any] = (
-            copy.deepcopy(default_config) if default_config else {}
+            _clone(default_config) if default_config else {}
         )
         self._schema: dict[str, Any] | None = schema
-        self._lock_timeout: float = lock_timeout
-        self._stale_lock_timeout: float = stale_lock_timeout
+        self._durable: bool = durable
         self._logger: logging.Logger = logging.getLogger("cliframework.config")
         self._mem_lock = threading.RLock()
+        # One FileLock per provider; _io_lock keeps threads from sharing it.
+        self._io_lock = threading.Lock()
+        self._file_lock = FileLock(
+            self._config_path,
+            timeout=lock_timeout,
+            stale_timeout=stale_lock_timeout,
+        )
+        self._validator: Any | None = None
+        self._revision: int = 0
+        self._saved_revision: int = -1
+        self._validated_revision: int = -1
+        self._saved_digest: bytes | None = None
+        # os.stat() stamp of the file as this provider last wrote or loaded it.
+        self._saved_stamp: tuple[int, int, int, int] | None = None
+        # Whether that write was fsynced; a durable save must not skip past it.
+        self._saved_durable: bool = False
+        # Dotted key -> non-dict leaf; patched by set()/delete(), rebuilt
+        # lazily after update() or a load merge.
+        self._flat: dict[str, Any] | None = None
+        self._config_dir: str = os.path.dirname(self._config_path) or "."
+        self._temp_base: str = f"{self._config_path}.tmp."
 
         if self._schema and not JSONSCHEMA_AVAILABLE:
             self._logger.warning(
@@ -400,51 +674,74 @@ class JsonConfigProvider(ConfigProvider):
             )
             self._schema = None
 
+        if self._schema:
+            validator_cls = jsonschema.validators.validator_for(self._schema)
+            try:
+                validator_cls.check_schema(self._schema)
+            except jsonschema.exceptions.SchemaError as exc:
+                raise ConfigValidationError(
+                    f"Invalid configuration schema: {exc.message}"
+                )
+            self._validator = validator_cls(self._schema)
+
         try:
-            os.makedirs(
-                os.path.dirname(self._config_path) or ".", exist_ok=True
-            )
+            os.makedirs(self._config_dir, exist_ok=True)
         except OSError as exc:
             raise ConfigError(f"Failed to create config directory: {exc}")
 
-        if not os.path.exists(self._config_path) and default_config:
+        try:
+            os.stat(self._config_path)
+            config_exists = True
+        except FileNotFoundError:
+            config_exists = False
+
+        if not config_exists and default_config:
             try:
-                self._save_to_file(self._config)
+                self._save_to_file(self._config, durable=self._durable)
+                config_exists = True
             except Exception as exc:
                 self._logger.error(f"Failed to create config file: {exc}")
 
-        self._load()
+        if config_exists:
+            self._load()
 
     def get(self, key: str, default: Any = None) -> Any:
         with self._mem_lock:
-            parts: list[str] = key.split(".")
-            config: Any = self._config
-            for part in parts[:-1]:
-                if not isinstance(config, dict) or part not in config:
+            if self._flat is None:
+                self._flat = _flatten(self._config)
+            try:
+                value: Any = self._flat[key]
+            except KeyError:
+                value = self._config
+                try:
+                    for part in _split_key(key):
+                        value = value[part]
+                except (KeyError, TypeError):
                     return default
-                config = config[part]
-            if not isinstance(config, dict):
-                return default
-            value = config.get(parts[-1], default)
             return (
                 copy.deepcopy(value) if isinstance(value, (dict, list)) else value
             )
 
     def set(self, key: str, value: Any) -> None:
         with self._mem_lock:
-            parts: list[str] = key.split(".")
+            parts = _split_key(key)
             config: dict[str, Any] = self._config
-            for part in parts[:-1]:
-                if part not in config:
-                    config[part] = {}
-                elif not isinstance(config[part], dict):
+            for depth, part in enumerate(parts[:-1], 1):
+                child = config.setdefault(part, {})
+                if not isinstance(child, dict):
                     self._logger.warning(
                         f"Overwriting non-dict value at key '{part}' "
                         f"to create nested structure"
                     )
-                    config[part] = {}
-                config = config[part]
-            config[parts[-1]] = copy.deepcopy(value)
+                    child = config[part] = {}
+                    if self._flat is not None:
+                        self._flat.pop(".".join(parts[:depth]), None)
+                config = child
+            previous = config.get(parts[-1])
+            config[parts[-1]] = stored = copy.deepcopy(value)
+            self._revision += 1
+            self._unindex(key, previous)
+            self._index(key, stored)
 
             try:
                 self._validate_schema(self._config)
@@ -453,10 +750,11 @@ class JsonConfigProvider(ConfigProvider):
                     f"Setting key '{key}' resulted in schema-invalid state"
                 )
                 raise
+            self._validated_revision = self._revision
 
     def delete(self, key: str) -> bool:
         with self._mem_lock:
-            parts: list[str] = key.split(".")
+            parts = _split_key(key)
             config: Any = self._config
             for part in parts[:-1]:
                 if not isinstance(config, dict) or part not in config:
@@ -464,73 +762,102 @@ class JsonConfigProvider(ConfigProvider):
                 config = config[part]
             if not isinstance(config, dict) or parts[-1] not in config:
                 return False
-            del config[parts[-1]]
+            self._unindex(key, config.pop(parts[-1]))
+            self._revision += 1
             return True
 
-    def save(self) -> None:
-        with self._mem_lock:
-            snapshot = copy.deepcopy(self._config)
+    def _index(self, key: str, value: Any) -> None:
+        # Patch _flat for the subtree at key rather than rebuilding it.
+        if self._flat is None:
+            return
+        if isinstance(value, dict):
+            for sub, leaf in _flatten(value).items():
+                self._flat[f"{key}.{sub}"] = leaf
+        else:
+            self._flat[key] = value
 
-        lock = FileLock(
-            self._config_path,
-            timeout=self._lock_timeout,
-            stale_timeout=self._stale_lock_timeout,
-        )
-        try:
-            with lock:
-                self._save_to_file(snapshot)
-        except (ConfigLockError, ConfigIOError, ConfigValidationError):
-            raise
-        except Exception as exc:
-            raise ConfigIOError(f"Unexpected error saving config: {exc}")
+    def _unindex(self, key: str, value: Any) -> None:
+        if self._flat is None:
+            return
+        if isinstance(value, dict):
+            for sub in _flatten(value):
+                self._flat.pop(f"{key}.{sub}", None)
+        else:
+            self._flat.pop(key, None)
+
+    def save(self, durable: bool | None = None) -> None:
+        """
+        Write the config to disk; a no-op when nothing changed since the last sync.
+
+        durable=False skips fsync: the write stays atomic (temp file +
+        rename) but may be lost on power failure. None uses the provider default.
+        """
+        with self._io_lock:
+            if durable is None:
+                durable = self._durable
+            with self._mem_lock:
+                revision = self._revision
+                if (
+                    revision == self._saved_revision
+                    and self._unchanged_on_disk(durable)
+                ):
+                    return
+                validated = revision == self._validated_revision
+                snapshot = _clone(self._config)
+
+            try:
+                with self._file_lock:
+                    self._save_to_file(
+                        snapshot, durable=durable, validated=validated
+                    )
+            except (ConfigLockError, ConfigIOError, ConfigValidationError):
+                raise
+            except Exception as exc:
+                raise ConfigIOError(f"Unexpected error saving config: {exc}")
+            with self._mem_lock:
+                self._saved_revision = revision
 
     def get_all(self) -> dict[str, Any]:
         with self._mem_lock:
-            return copy.deepcopy(self._config)
+            return _clone(self._config)
 
     def update(self, config: dict[str, Any]) -> None:
         with self._mem_lock:
             updated = deep_merge(self._config, config)
             self._validate_schema(updated)
             self._config = updated
+            self._flat = None
+            self._revision += 1
+            self._validated_revision = self._revision
 
     def _validate_schema(self, config: dict[str, Any]) -> None:
-        if not self._schema or not JSONSCHEMA_AVAILABLE:
+        if self._validator is None:
             return
         try:
-            jsonschema.validate(instance=config, schema=self._schema)
+            self._validator.validate(config)
         except jsonschema.exceptions.ValidationError as exc:
             raise ConfigValidationError(
                 f"Configuration validation failed: {exc.message}"
             )
 
     def _load(self) -> None:
-        if not os.path.exists(self._config_path):
-            return
-
-        lock = FileLock(
-            self._config_path,
-            timeout=self._lock_timeout,
-            stale_timeout=self._stale_lock_timeout,
-        )
-
         try:
-            with lock:
-                with open(self._config_path, "r", encoding="utf-8") as f:
-                    loaded_config: dict[str, Any] = json.load(f)
+            with self._io_lock, self._file_lock:
+                stamp, loaded_config = _read_config(self._config_path)
                 self._validate_schema(loaded_config)
-                with self._mem_lock:
-                    self._config = deep_merge(self._config, loaded_config)
+                self._merge_loaded(loaded_config, stamp)
+        except FileNotFoundError:
+            return
         except ConfigLockError:
             self._logger.warning(
                 "Could not acquire lock for reading config; reading without lock"
             )
             try:
-                with open(self._config_path, "r", encoding="utf-8") as f:
-                    loaded_config = json.load(f)
+                stamp, loaded_config = _read_config(self._config_path)
                 self._validate_schema(loaded_config)
-                with self._mem_lock:
-                    self._config = deep_merge(self._config, loaded_config)
+                self._merge_loaded(loaded_config, stamp)
+            except FileNotFoundError:
+                return
             except Exception as read_err:
                 self._logger.error(
                     f"Failed to read config even without lock: {read_err}"
@@ -551,48 +878,106 @@ class JsonConfigProvider(ConfigProvider):
                 f"Unexpected error loading config: {exc}", exc_info=True
             )
 
+    def _merge_loaded(
+        self,
+        loaded_config: dict[str, Any],
+        stamp: tuple[int, int, int, int],
+    ) -> None:
+        with self._mem_lock:
+            _merge_into(self._config, loaded_config)
+            self._flat = None
+            if self._config == loaded_config:
+                self._saved_revision = self._revision
+                self._validated_revision = self._revision
+                if stamp != self._saved_stamp:
+                    # Someone else's file: nothing of ours is left to fsync,
+                    # and our last payload digest no longer describes it.
+                    self._saved_stamp = stamp
+                    self._saved_digest = None
+                    self._saved_durable = True
+
     def _attempt_recovery(self) -> None:
         try:
             backup_path = f"{self._config_path}.corrupt.{int(time.time())}"
-            if os.path.exists(self._config_path):
-                import shutil
+            import shutil
 
+            try:
                 shutil.copy(self._config_path, backup_path)
                 self._logger.info(
                     f"Created backup of corrupted config: {backup_path}"
                 )
+            except FileNotFoundError:
+                pass
 
             with self._mem_lock:
+                revision = self._revision
                 snapshot = copy.deepcopy(self._config)
 
             if snapshot:
                 self._validate_schema(snapshot)
-                self._save_to_file(snapshot)
+                self._save_to_file(
+                    snapshot, durable=self._durable, validated=True
+                )
+                with self._mem_lock:
+                    self._saved_revision = revision
         except Exception as exc:
             self._logger.error(f"Recovery failed: {exc}")
             raise ConfigError(f"Failed to recover configuration: {exc}")
 
-    def _save_to_file(self, config: dict[str, Any]) -> None:
-        self._validate_schema(config)
-        temp_dir = os.path.dirname(self._config_path) or "."
-        temp_fd, temp_path = tempfile.mkstemp(
-            suffix=".json",
-            prefix=f"{os.path.basename(self._config_path)}.",
-            dir=temp_dir,
+    def _save_to_file(
+        self,
+        config: dict[str, Any],
+        durable: bool = True,
+        validated: bool = False,
+    ) -> None:
+        if not validated:
+            self._validate_schema(config)
+        try:
+            payload = _dumps(config)
+        except Exception as exc:
+            raise ConfigIOError(f"Failed to save config: {exc}")
+        digest = hashlib.blake2b(payload, digest_size=16).digest()
+        if digest == self._saved_digest and self._unchanged_on_disk(durable):
+            return
+
+        # Writers are already serialized by the file lock and _io_lock, so a
+        # per-process, per-thread name is unique without mkstemp()'s retries.
+        # O_EXCL still refuses to write through whatever already sits there
+        # (a crashed save's leftover, a planted link); unlink it and retry.
+        temp_path = f"{self._temp_base}{_PID}.{threading.get_ident()}.json"
+        flags = (
+            os.O_WRONLY
+            | os.O_CREAT
+            | os.O_EXCL
+            | getattr(os, "O_NOFOLLOW", 0)
+            | getattr(os, "O_BINARY", 0)
         )
         try:
-            with os.fdopen(temp_fd, "w", encoding="utf-8") as f:
-                json.dump(
-                    config, f, indent=2, ensure_ascii=False, sort_keys=True
-                )
-                f.flush()
-                os.fsync(f.fileno())
-            os.replace(temp_path, self._config_path)
             try:
-                if LOCK_METHOD == "posix":
-                    os.chmod(self._config_path, 0o600)
-            except OSError as exc:
-                self._logger.debug(f"Could not chmod config to 0o600: {exc}")
+                temp_fd = os.open(temp_path, flags, 0o600)
+            except FileExistsError:
+                os.unlink(temp_path)
+                temp_fd = os.open(temp_path, flags, 0o600)
+        except OSError as exc:
+            raise ConfigIOError(f"Failed to save config: {exc}")
+        try:
+            try:
+                pending = memoryview(payload)
+                while pending:
+                    pending = pending[os.write(temp_fd, pending) :]
+                if durable:
+                    os.fsync(temp_fd)
+            finally:
+                os.close(temp_fd)
+            # The temp file is created 0o600 and os.replace() keeps that
+            # mode, so no chmod is needed after the rename.
+            os.replace(temp_path, self._config_path)
+            _forget_parsed(self._config_path)
+            if durable and hasattr(os, "O_DIRECTORY"):
+                self._fsync_directory(self._config_dir)
+            self._saved_digest = digest
+            self._saved_stamp = self._disk_stamp()
+            self._saved_durable = durable
         except Exception as exc:
             try:
                 if os.path.exists(temp_path):
@@ -601,6 +986,35 @@ class JsonConfigProvider(ConfigProvider):
                 pass
             raise ConfigIOError(f"Failed to save config: {exc}")
 
+    def _disk_stamp(self) -> tuple[int, int, int, int] | None:
+        try:
+            st = os.stat(self._config_path)
+        except OSError:
+            return None
+        return (st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size)
+
+    def _unchanged_on_disk(self, durable: bool) -> bool:
+        # Another writer may have replaced the file since our last save, and
+        # a durable save still has to fsync what a non-durable one left behind.
+        if durable and not self._saved_durable:
+            return False
+        stamp = self._disk_stamp()
+        return stamp is not None and stamp == self._saved_stamp
+
+    def _fsync_directory(self, path: str) -> None:
+        # Persist the rename itself; fsyncing the file only covers its data.
+        try:
+            dir_fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+        except OSError as exc:
+            self._logger.debug(f"Could not open config directory: {exc}")
+            return
+        try:
+            os.fsync(dir_fd)
+        except OSError as exc:
+            self._logger.debug(f"Could not fsync config directory: {exc}")
+        finally:
+            os.close(dir_fd)
+
 
 __all__ = [
     "ConfigError",
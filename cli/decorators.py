@@ -18,7 +18,6 @@ the registry, so the same metadata can be claimed by multiple CLIs.
 
 from __future__ import annotations
 
-import copy
 import inspect
 import logging
 import threading
@@ -35,11 +34,27 @@ F = TypeVar("F", bound=Callable[..., Any])
 _MISSING = object()
 
 
+_async_cache: WeakKeyDictionary[Callable[..., Any], bool] = WeakKeyDictionary()
+
+
 def is_async_function(func: Callable[..., Any]) -> bool:
-    return inspect.iscoroutinefunction(func)
+    # Memoised in a side table, not on the function: functools.wraps copies
+    # __dict__, so an attribute would leak into sync wrappers of async code.
+    try:
+        return _async_cache[func]
+    except (KeyError, TypeError):
+        pass
+    result = inspect.iscoroutinefunction(func)
+    try:
+        _async_cache[func] = result
+    except TypeError:
+        pass
+    return result
 
 
 def _unwrap(func: Callable[..., Any]) -> Callable[..., Any]:
+    if not hasattr(func, "__wrapped__"):
+        return func
     seen: set[int] = set()
     current = func
     while hasattr(current, "__wrapped__"):
@@ -73,8 +88,26 @@ def _validate_name_not_reserved(name: str, context: str) -> None:
         )
 
 
+def _copy_metadata(meta: dict[str, Any]) -> dict[str, Any]:
+    """Copy metadata down to the argument/option dicts; leaf values are shared."""
+    copied = dict(meta)
+    for key, value in meta.items():
+        if isinstance(value, list):
+            copied[key] = [
+                dict(item) if isinstance(item, dict) else item for item in value
+            ]
+    return copied
+
+
 class CommandMetadataRegistry:
-    """Thread-safe registry for command metadata using weak references."""
+    """
+    Thread-safe registry for command metadata using weak references.
+
+    Writers serialize on the lock and publish replacement objects instead of
+    mutating stored ones, so single-key reads can skip the lock.
+    """
+
+    __slots__ = ("_metadata", "_group_methods", "_group_classes", "_lock")
 
     def __init__(self) -> None:
         self._metadata: WeakKeyDictionary[Callable[..., Any], dict[str, Any]] = (
@@ -87,41 +120,57 @@ class CommandMetadataRegistry:
     def get_metadata(
         self, func: Callable[..., Any]
     ) -> dict[str, Any] | None:
-        with self._lock:
-            meta = self._metadata.get(func)
-            return copy.deepcopy(meta) if meta is not None else None
+        meta = self._metadata.get(func)
+        return _copy_metadata(meta) if meta is not None else None
+
+    def has_metadata(self, func: Callable[..., Any]) -> bool:
+        return func in self._metadata
 
     def set_metadata(
         self, func: Callable[..., Any], metadata: dict[str, Any]
     ) -> None:
         with self._lock:
-            self._metadata[func] = copy.deepcopy(metadata)
+            self._metadata[func] = _copy_metadata(metadata)
 
     def update_metadata(
         self, func: Callable[..., Any], updates: dict[str, Any]
     ) -> None:
         with self._lock:
-            current = self._metadata.get(func, {})
-            current.update(copy.deepcopy(updates))
+            current = dict(self._metadata.get(func, {}))
+            current.update(_copy_metadata(updates))
+            self._metadata[func] = current
+
+    def mutate(
+        self,
+        func: Callable[..., Any],
+        mutator: Callable[[dict[str, Any]], None],
+    ) -> None:
+        """Apply mutator to a private copy of func's metadata, then publish it."""
+        with self._lock:
+            current = _copy_metadata(self._metadata.get(func, {}))
+            mutator(current)
             self._metadata[func] = current
 
     def register_group_class(
         self, group_name: str, cls: Type[Any]
     ) -> None:
         with self._lock:
-            self._group_classes[group_name] = cls
+            self._group_classes = {**self._group_classes, group_name: cls}
 
     def get_group_classes(self) -> dict[str, Type[Any]]:
-        with self._lock:
-            return dict(self._group_classes)
+        return dict(self._group_classes)
 
     def mark_as_group_method(self, func: Callable[..., Any]) -> None:
         with self._lock:
             self._group_methods.add(func)
 
     def is_group_method(self, func: Callable[..., Any]) -> bool:
+        return func in self._group_methods
+
+    def snapshot(self) -> dict[Callable[..., Any], dict[str, Any]]:
+        """Current entries without copying them; callers must not mutate."""
         with self._lock:
-            return func in self._group_methods
+            return dict(self._metadata.items())
 
     def all_functions(self) -> list[Callable[..., Any]]:
         with self._lock:
@@ -130,7 +179,7 @@ class CommandMetadataRegistry:
     def clear(self) -> None:
         with self._lock:
             self._metadata.clear()
-            self._group_classes.clear()
+            self._group_classes = {}
             self._group_methods.clear()
 
 
@@ -145,11 +194,10 @@ def get_default_registry() -> CommandMetadataRegistry:
 def _ensure_command_metadata(
     func: Callable[..., Any],
     registry: CommandMetadataRegistry,
-) -> dict[str, Any]:
+) -> None:
     target = _unwrap(func)
-    existing = registry.get_metadata(target)
-    if existing is not None:
-        return existing
+    if registry.has_metadata(target):
+        return
 
     cmd_name: str = func.__name__
     help_text: str = inspect.getdoc(func) or f"Command {cmd_name}"
@@ -157,6 +205,7 @@ def _ensure_command_metadata(
 
     arguments: list[dict[str, Any]] = []
     options: list[dict[str, Any]] = []
+    empty = inspect.Parameter.empty
 
     for param_name, param in sig.parameters.items():
         if param_name in ("self", "cls"):
@@ -164,12 +213,10 @@ def _ensure_command_metadata(
         _validate_name_not_reserved(param_name, "parameter")
 
         param_type: Any = (
-            param.annotation
-            if param.annotation is not inspect.Parameter.empty
-            else str
+            param.annotation if param.annotation is not empty else str
         )
 
-        if param.default is not inspect.Parameter.empty:
+        if param.default is not empty:
             options.append(
                 {
                     "name": param_name,
@@ -206,7 +253,6 @@ def _ensure_command_metadata(
         "is_group": False,
     }
     registry.set_metadata(target, metadata)
-    return metadata
 
 
 def _make_command(registry: CommandMetadataRegistry):
@@ -241,6 +287,14 @@ def _make_command(registry: CommandMetadataRegistry):
     return command
 
 
+def _without(
+    specs: list[dict[str, Any]], name: str
+) -> tuple[list[dict[str, Any]], bool]:
+    """Drop the spec called name in one pass; report whether it was there."""
+    kept = [spec for spec in specs if spec["name"] != name]
+    return kept, len(kept) != len(specs)
+
+
 def _make_argument(registry: CommandMetadataRegistry):
     def argument(
         name: str,
@@ -254,33 +308,31 @@ def _make_argument(registry: CommandMetadataRegistry):
                 raise TypeError("@argument can only be applied to callable")
             _validate_name_not_reserved(name, "argument")
             target = _unwrap(func)
-            metadata = _ensure_command_metadata(func, registry)
-
-            arguments = list(metadata.get("arguments", []))
-            options = list(metadata.get("options", []))
-
-            if name in [a["name"] for a in arguments]:
-                arguments = [a for a in arguments if a["name"] != name]
-            if name in [o["name"] for o in options]:
-                warnings.warn(
-                    f"Option '{name}' being redefined as argument in command "
-                    f"'{metadata['name']}'",
-                    stacklevel=2,
+            _ensure_command_metadata(func, registry)
+
+            def apply(metadata: dict[str, Any]) -> None:
+                arguments, _ = _without(metadata.get("arguments", []), name)
+                options, clashed = _without(metadata.get("options", []), name)
+                if clashed:
+                    warnings.warn(
+                        f"Option '{name}' being redefined as argument in "
+                        f"command '{metadata['name']}'",
+                        stacklevel=4,
+                    )
+
+                arguments.append(
+                    {
+                        "name": name,
+                        "help": help or f"Argument {name}",
+                        "type": type,
+                        "optional": optional,
+                        "group": group,
+                    }
                 )
-                options = [o for o in options if o["name"] != name]
+                metadata["arguments"] = arguments
+                metadata["options"] = options
 
-            arguments.append(
-                {
-                    "name": name,
-                    "help": help or f"Argument {name}",
-                    "type": type,
-                    "optional": optional,
-                    "group": group,
-                }
-            )
-            registry.update_metadata(
-                target, {"arguments": arguments, "options": options}
-            )
+            registry.mutate(target, apply)
             return func
 
         return decorator
@@ -288,22 +340,24 @@ def _make_argument(registry: CommandMetadataRegistry):
     return argument
 
 
-def _validate_short_uniqueness(
+def _drop_option(
     options: list[dict[str, Any]],
     new_short: str | None,
     new_name: str,
     command_name: str,
-) -> None:
-    if new_short is None:
-        return
+) -> list[dict[str, Any]]:
+    """Drop new_name's old spec, rejecting a short flag another option owns."""
+    kept: list[dict[str, Any]] = []
     for opt in options:
         if opt["name"] == new_name:
             continue
-        if opt.get("short") == new_short:
+        if new_short is not None and opt.get("short") == new_short:
             raise ValueError(
                 f"Short option '-{new_short}' conflicts with existing option "
                 f"'--{opt['name']}' in command '{command_name}'"
             )
+        kept.append(opt)
+    return kept
 
 
 def _make_option(registry: CommandMetadataRegistry):
@@ -340,28 +394,7 @@ def _make_option(registry: CommandMetadataRegistry):
                 _validate_name_not_reserved(normalized_short, "short option")
 
             target = _unwrap(func)
-            metadata = _ensure_command_metadata(func, registry)
-
-            options = list(metadata.get("options", []))
-            arguments = list(metadata.get("arguments", []))
-
-            _validate_short_uniqueness(
-                options, normalized_short, normalized_name, metadata["name"]
-            )
-
-            if normalized_name in [o["name"] for o in options]:
-                options = [
-                    o for o in options if o["name"] != normalized_name
-                ]
-            if normalized_name in [a["name"] for a in arguments]:
-                warnings.warn(
-                    f"Argument '{normalized_name}' being redefined as option in "
-                    f"command '{metadata['name']}'",
-                    stacklevel=2,
-                )
-                arguments = [
-                    a for a in arguments if a["name"] != normalized_name
-                ]
+            _ensure_command_metadata(func, registry)
 
             resolved_default: Any = (
                 None if default is _MISSING else default
@@ -371,22 +404,40 @@ def _make_option(registry: CommandMetadataRegistry):
                 else _is_flag_param(type, resolved_default)
             )
 
-            options.append(
-                {
-                    "name": normalized_name,
-                    "short": normalized_short,
-                    "help": help or f"Option {normalized_name}",
-                    "type": type,
-                    "default": resolved_default,
-                    "default_factory": default_factory,
-                    "is_flag": resolved_is_flag,
-                    "group": group,
-                    "exclusive_group": exclusive_group,
-                }
-            )
-            registry.update_metadata(
-                target, {"options": options, "arguments": arguments}
-            )
+            def apply(metadata: dict[str, Any]) -> None:
+                options = _drop_option(
+                    metadata.get("options", []),
+                    normalized_short,
+                    normalized_name,
+                    metadata["name"],
+                )
+                arguments, clashed = _without(
+                    metadata.get("arguments", []), normalized_name
+                )
+                if clashed:
+                    warnings.warn(
+                        f"Argument '{normalized_name}' being redefined as "
+                        f"option in command '{metadata['name']}'",
+                        stacklevel=4,
+                    )
+
+                options.append(
+                    {
+                        "name": normalized_name,
+                        "short": normalized_short,
+                        "help": help or f"Option {normalized_name}",
+                        "type": type,
+                        "default": resolved_default,
+                        "default_factory": default_factory,
+                        "is_flag": resolved_is_flag,
+                        "group": group,
+                        "exclusive_group": exclusive_group,
+                    }
+                )
+                metadata["options"] = options
+                metadata["arguments"] = arguments
+
+            registry.mutate(target, apply)
             return func
 
         return decorator
@@ -400,10 +451,13 @@ def _make_example(registry: CommandMetadataRegistry):
             if not callable(func):
                 raise TypeError("@example can only be applied to callable")
             target = _unwrap(func)
-            metadata = _ensure_command_metadata(func, registry)
-            examples = list(metadata.get("examples", []))
-            examples.append(example_text)
-            registry.update_metadata(target, {"examples": examples})
+            _ensure_command_metadata(func, registry)
+            registry.mutate(
+                target,
+                lambda metadata: metadata.setdefault("examples", []).append(
+                    example_text
+                ),
+            )
             return func
 
         return decorator
@@ -422,19 +476,21 @@ def _make_group(registry: CommandMetadataRegistry):
             )
 
             command_methods: list[tuple[str, Callable[..., Any]]] = []
-            for attr_name in dir(cls):
-                if attr_name.startswith("_"):
-                    continue
-                try:
-                    attr = getattr(cls, attr_name)
-                except AttributeError:
-                    continue
-                if not callable(attr):
-                    continue
-                target = _unwrap(attr)
-                if registry.get_metadata(target) is not None:
-                    registry.mark_as_group_method(target)
-                    command_methods.append((attr_name, attr))
+            seen: set[str] = set()
+            for klass in cls.__mro__:
+                for attr_name in vars(klass):
+                    if attr_name.startswith("_") or attr_name in seen:
+                        continue
+                    seen.add(attr_name)
+                    attr = getattr(cls, attr_name, None)
+                    if not callable(attr):
+                        continue
+                    target = _unwrap(attr)
+                    if registry.has_metadata(target):
+                        registry.mark_as_group_method(target)
+                        command_methods.append((attr_name, attr))
+            # Sort by name to keep the alphabetical order dir() used to give.
+            command_methods.sort(key=lambda item: item[0])
 
             cls.__cli_group_info__ = {
                 "name": group_name,
@@ -500,30 +556,45 @@ def register_commands(
     return count
 
 
+def _build_register_kwargs(
+    metadata: dict[str, Any], is_group: bool
+) -> dict[str, Any]:
+    """Build the keyword arguments for ``commands.register()``.
+
+    List fields are passed by reference: the registry entries are never
+    mutated in place and ``register()`` copies what it keeps.
+    """
+    get = metadata.get
+    return {
+        "help": get("help", ""),
+        "arguments": get("arguments", []),
+        "options": get("options", []),
+        "aliases": get("aliases", []),
+        "examples": get("examples", []),
+        "is_async": get("is_async", False),
+        "is_group": is_group,
+    }
+
+
 def _register_from(
     cli_instance: Any,
     registry: CommandMetadataRegistry,
     registered: WeakSet[Callable[..., Any]],
 ) -> int:
+    # commands.register() deep-copies what it keeps, so the shared entries
+    # can be handed over as-is.
+    entries = registry.snapshot()
     count = 0
-    for func in registry.all_functions():
+    for func, metadata in entries.items():
         if func in registered or registry.is_group_method(func):
             continue
-        metadata = registry.get_metadata(func)
-        if metadata is None:
-            continue
         try:
-            payload = {
-                "help": metadata.get("help", ""),
-                "arguments": list(metadata.get("arguments", [])),
-                "options": list(metadata.get("options", [])),
-                "aliases": list(metadata.get("aliases", [])),
-                "examples": list(metadata.get("examples", [])),
-                "is_async": metadata.get("is_async", False),
-                "is_group": metadata.get("is_group", False),
-            }
             cli_instance.commands.register(
-                metadata["name"], metadata["handler"], **payload
+                metadata["name"],
+                metadata["handler"],
+                **_build_register_kwargs(
+                    metadata, metadata.get("is_group", False)
+                ),
             )
             registered.add(func)
             count += 1
@@ -553,24 +624,17 @@ def _register_from(
             target = _unwrap(method)
             if target in registered:
                 continue
-            metadata = registry.get_metadata(target)
+            metadata = entries.get(target)
             if not metadata:
                 continue
 
             bound_method = getattr(instance, method_name)
             full_name = f"{group_name}.{metadata['name']}"
-            payload = {
-                "help": metadata.get("help", ""),
-                "arguments": list(metadata.get("arguments", [])),
-                "options": list(metadata.get("options", [])),
-                "aliases": list(metadata.get("aliases", [])),
-                "examples": list(metadata.get("examples", [])),
-                "is_async": metadata.get("is_async", False),
-                "is_group": False,
-            }
             try:
                 cli_instance.commands.register(
-                    full_name, bound_method, **payload
+                    full_name,
+                    bound_method,
+                    **_build_register_kwargs(metadata, False),
                 )
                 registered.add(target)
                 count += 1
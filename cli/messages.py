@@ -7,13 +7,11 @@ in field names to prevent format-string attacks via config-injected templates.
 
 from __future__ import annotations
 
-import hashlib
-import json
+import functools
 import logging
 import string
 import threading
-from collections import OrderedDict
-from typing import Any
+from typing import Any, Callable
 
 from .interfaces import ConfigProvider, MessageProvider
 
@@ -38,9 +36,72 @@ class _SafeFormatter(string.Formatter):
 
 _safe_formatter = _SafeFormatter()
 
+_CONVERTERS: dict[str, Callable[[Any], str]] = {
+    "s": str,
+    "r": repr,
+    "a": ascii,
+}
+
+_SCALAR_TYPES: frozenset[type] = frozenset(
+    {str, int, float, bool, type(None)}
+)
+
+_Template = tuple[tuple[str, "str | None", str, "str | None"], ...]
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_template(message: str) -> _Template | None:
+    """Parse a message template once for repeated rendering.
+
+    Returns None for templates the fast renderer does not handle (positional
+    or nested replacement fields); those go through ``_safe_formatter``.
+    """
+    parsed = tuple(_safe_formatter.parse(message))
+    for _, field_name, format_spec, conversion in parsed:
+        if field_name is None:
+            continue
+        if "." in field_name or "[" in field_name:
+            raise MessageError(
+                f"Attribute access or indexing not allowed in message templates: "
+                f"'{field_name}'"
+            )
+        if not field_name or field_name.isdigit() or "{" in format_spec:
+            return None
+        if conversion is not None and conversion not in _CONVERTERS:
+            raise ValueError(
+                f"Unknown conversion specifier {conversion}"
+            )
+    return parsed
+
+
+def _render(message: str, kwargs: dict[str, Any]) -> str:
+    if "{" not in message and "}" not in message:
+        return message
+    template = _compile_template(message)
+    if template is None:
+        return _safe_formatter.format(message, **kwargs)
+    parts: list[str] = []
+    append = parts.append
+    for literal, field_name, format_spec, conversion in template:
+        if literal:
+            append(literal)
+        if field_name is None:
+            continue
+        value = kwargs[field_name]
+        if conversion is not None:
+            value = _CONVERTERS[conversion](value)
+        append(format(value, format_spec))
+    return "".join(parts)
+
 
 class ConfigBasedMessageProvider(MessageProvider):
-    """Configuration-based message provider with LRU caching and warn-once."""
+    """Configuration-based message provider with caching and warn-once.
+
+    Formatted messages live in two generations of plain dicts. Hits are
+    served without locking; when the young generation reaches
+    ``cache_size`` it becomes the old one and the previous old generation
+    is dropped, so recently used entries survive one rotation.
+    """
 
     def __init__(
         self,
@@ -56,7 +117,8 @@ class ConfigBasedMessageProvider(MessageProvider):
             "cliframework.messages"
         )
         self._cache_size: int = cache_size
-        self._message_cache: OrderedDict[str, str] = OrderedDict()
+        self._hot: dict[tuple[Any, ...], str] = {}
+        self._cold: dict[tuple[Any, ...], str] = {}
         self._cache_lock = threading.Lock()
         self._state_lock = threading.RLock()
         self._warned_keys: set[str] = set()
@@ -69,11 +131,9 @@ class ConfigBasedMessageProvider(MessageProvider):
         )
 
         config_langs: list[Any] = config.get("languages", []) or []
-        self._available_languages: set[str] = (
-            set(config_langs) if config_langs else {self._default_language}
-        )
-        self._available_languages.add(self._default_language)
-        self._available_languages.add(self._current_language)
+        self._available_languages: frozenset[str] = frozenset(
+            config_langs
+        ) | {self._default_language, self._current_language}
 
         if set(config_langs) != self._available_languages:
             try:
@@ -89,15 +149,16 @@ class ConfigBasedMessageProvider(MessageProvider):
         default: str | None = None,
         **kwargs: Any,
     ) -> str:
-        with self._state_lock:
-            current_language = self._current_language
-
+        current_language = self._current_language
         cache_key = self._cache_key(current_language, key, default, kwargs)
 
-        with self._cache_lock:
-            if cache_key in self._message_cache:
-                self._message_cache.move_to_end(cache_key)
-                return self._message_cache[cache_key]
+        cached = self._hot.get(cache_key)
+        if cached is not None:
+            return cached
+        cached = self._cold.get(cache_key)
+        if cached is not None:
+            self._cache_put(cache_key, cached)
+            return cached
 
         message: str | None = self._config.get(
             f"messages.{current_language}.{key}"
@@ -119,7 +180,7 @@ class ConfigBasedMessageProvider(MessageProvider):
 
         if kwargs:
             try:
-                message = _safe_formatter.format(message, **kwargs)
+                message = _render(message, kwargs)
             except MessageError as exc:
                 self._logger.error(
                     f"Unsafe template for message '{key}': {exc}"
@@ -133,13 +194,16 @@ class ConfigBasedMessageProvider(MessageProvider):
                     f"Error formatting message '{key}': {exc}"
                 )
 
-        with self._cache_lock:
-            if len(self._message_cache) >= self._cache_size:
-                self._message_cache.popitem(last=False)
-            self._message_cache[cache_key] = message
-
+        self._cache_put(cache_key, message)
         return message
 
+    def _cache_put(self, cache_key: tuple[Any, ...], message: str) -> None:
+        with self._cache_lock:
+            if len(self._hot) >= self._cache_size:
+                self._cold = self._hot
+                self._hot = {}
+            self._hot[cache_key] = message
+
     def set_language(self, language: str) -> None:
         with self._state_lock:
             if language not in self._available_languages:
@@ -151,7 +215,8 @@ class ConfigBasedMessageProvider(MessageProvider):
             self._current_language = language
             self._config.set("current_language", language)
             with self._cache_lock:
-                self._message_cache.clear()
+                self._hot = {}
+                self._cold = {}
 
         try:
             self._config.save()
@@ -164,9 +229,8 @@ class ConfigBasedMessageProvider(MessageProvider):
         with self._state_lock:
             return self._current_language
 
-    def get_available_languages(self) -> set[str]:
-        with self._state_lock:
-            return set(self._available_languages)
+    def get_available_languages(self) -> frozenset[str]:
+        return self._available_languages
 
     def add_language(
         self, language: str, messages: dict[str, str]
@@ -178,12 +242,15 @@ class ConfigBasedMessageProvider(MessageProvider):
                 )
                 existing_messages.update(messages)
                 self._config.set(f"messages.{language}", existing_messages)
-                self._available_languages.add(language)
+                self._available_languages = self._available_languages | {
+                    language
+                }
                 self._config.set(
                     "languages", sorted(self._available_languages)
                 )
                 with self._cache_lock:
-                    self._message_cache.clear()
+                    self._hot = {}
+                    self._cold = {}
             except Exception as exc:
                 self._logger.error(
                     f"Error adding language '{language}': {exc}"
@@ -215,14 +282,17 @@ class ConfigBasedMessageProvider(MessageProvider):
                 raise MessageError(f"Language '{language}' not found")
 
             try:
-                self._available_languages.discard(language)
+                self._available_languages = self._available_languages - {
+                    language
+                }
                 self._config.set(
                     "languages", sorted(self._available_languages)
                 )
                 if purge:
                     self._config.delete(f"messages.{language}")
                 with self._cache_lock:
-                    self._message_cache.clear()
+                    self._hot = {}
+                    self._cold = {}
             except Exception as exc:
                 self._logger.error(
                     f"Error removing language '{language}': {exc}"
@@ -238,7 +308,8 @@ class ConfigBasedMessageProvider(MessageProvider):
 
     def clear_cache(self) -> None:
         with self._cache_lock:
-            self._message_cache.clear()
+            self._hot = {}
+            self._cold = {}
 
     @staticmethod
     def _cache_key(
@@ -246,43 +317,41 @@ class ConfigBasedMessageProvider(MessageProvider):
         key: str,
         default: str | None,
         kwargs: dict[str, Any],
-    ) -> str:
-        parts = [language, key]
-        if default is not None:
-            parts.append(
-                hashlib.blake2b(
-                    default.encode("utf-8"), digest_size=4
-                ).hexdigest()
+    ) -> tuple[Any, ...]:
+        if not kwargs:
+            if default is None:
+                return (language, key)
+            return (language, key, default)
+        items = sorted(kwargs.items())
+        if all(type(value) in _SCALAR_TYPES for _, value in items):
+            # The type is part of the key: 1, 1.0 and True compare equal
+            # but format differently.
+            params = tuple(
+                (name, type(value), value) for name, value in items
             )
-        if kwargs:
-            sorted_items = sorted(kwargs.items())
-            params_repr = []
-            for k, v in sorted_items:
-                params_repr.append(
-                    f"{k}:{ConfigBasedMessageProvider._canonicalize(v)}"
-                )
-            params_str = "|".join(params_repr)
-            parts.append(
-                hashlib.blake2b(
-                    params_str.encode("utf-8"), digest_size=8
-                ).hexdigest()
-            )
-        return ":".join(parts)
+            return (language, key, default, params)
+        canonicalize = ConfigBasedMessageProvider._canonicalize
+        params = tuple(
+            (name, type(value), canonicalize(value)) for name, value in items
+        )
+        return (language, key, default, params)
 
     @staticmethod
-    def _canonicalize(value: Any) -> str:
-        if isinstance(value, (str, int, float, bool, type(None))):
-            return str(value)
+    def _canonicalize(value: Any) -> Any:
+        if type(value) in _SCALAR_TYPES:
+            return value
         try:
-            if isinstance(value, (list, tuple)):
-                return json.dumps(
-                    list(value), sort_keys=True, ensure_ascii=False
-                )
             if isinstance(value, dict):
-                return json.dumps(value, sort_keys=True, ensure_ascii=False)
-            return str(value)
-        except (TypeError, ValueError):
+                try:
+                    return repr(sorted(value.items()))
+                except TypeError:
+                    return repr(value)
+            if isinstance(value, (list, tuple)):
+                return repr(value)
             return str(value)
+        except RecursionError:
+            # Too deep to describe; a fresh sentinel never matches again.
+            return object()
 
 
 __all__ = ["MessageError", "ConfigBasedMessageProvider"]
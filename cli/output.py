@@ -4,7 +4,9 @@ Terminal output formatting with ANSI colors and styles.
 
 from __future__ import annotations
 
+import contextlib
 import csv
+import functools
 import json
 import logging
 import os
@@ -15,7 +17,7 @@ import sys
 import textwrap
 import threading
 import time
-from typing import Any, Callable, TextIO
+from typing import Any, Callable, Iterator, TextIO
 
 from .interfaces import OutputFormatter
 
@@ -28,7 +30,8 @@ _ANSI_REGEX: re.Pattern[str] = re.compile(
     r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~]|\][0-9;]*(?:\x07|\x1b\\))"
 )
 
-_ANSI_PREFIX_REGEX: re.Pattern[str] = re.compile(r"^(\033\[[0-9;]+m)+")
+
+_IS_WINDOWS: bool = platform.system() == "Windows"
 
 _COLORAMA_INIT_LOCK = threading.Lock()
 _COLORAMA_INITIALIZED = False
@@ -37,7 +40,7 @@ _COLORAMA_INITIALIZED = False
 def _ensure_colorama_initialized() -> None:
     """Lazily initialize colorama on Windows; safe to call repeatedly."""
     global _COLORAMA_INITIALIZED
-    if _COLORAMA_INITIALIZED or platform.system() != "Windows":
+    if _COLORAMA_INITIALIZED or not _IS_WINDOWS:
         return
     with _COLORAMA_INIT_LOCK:
         if _COLORAMA_INITIALIZED:
@@ -91,6 +94,11 @@ STYLES: dict[str, str] = {
     "highlight": COLORS["reverse"],
 }
 
+_ANSI_CLEAR_LINE = "\r\033[K"
+
+_HEADER_PREFIX: str = STYLES["header"]
+_RESET: str = COLORS["reset"]
+
 _BG_COLOR_MAP: dict[str, str] = {
     "black": "\033[40m",
     "red": "\033[41m",
@@ -132,7 +140,7 @@ _KNOWN_TERMS: frozenset[str] = frozenset(
 
 
 def _enable_windows_vt_mode_for_handle(win_handle_const: int) -> bool:
-    if platform.system() != "Windows":
+    if not _IS_WINDOWS:
         return True
     try:
         import ctypes
@@ -150,8 +158,9 @@ def _enable_windows_vt_mode_for_handle(win_handle_const: int) -> bool:
         return False
 
 
+@functools.lru_cache(maxsize=1)
 def _enable_windows_vt_mode() -> bool:
-    if platform.system() != "Windows":
+    if not _IS_WINDOWS:
         return True
     try:
         ok_out = _enable_windows_vt_mode_for_handle(-11)
@@ -169,8 +178,7 @@ def _supports_color() -> bool:
     if os.environ.get("PYCHARM_HOSTED") == "1":
         return True
 
-    plat = platform.system()
-    if plat == "Windows":
+    if _IS_WINDOWS:
         win_term = bool(
             os.environ.get("WT_SESSION")
             or os.environ.get("TERM_PROGRAM") == "vscode"
@@ -194,14 +202,59 @@ def _supports_color() -> bool:
     return hasattr(sys.stdout, "isatty") and sys.stdout.isatty()
 
 
+_COLOR_SUPPORT: bool | None = None
+
+
+def _get_color_support() -> bool:
+    """Return the cached result of ``_supports_color()``.
+
+    Detection reads the environment and, on Windows, reconfigures the
+    console, so it runs once per process.
+    """
+    global _COLOR_SUPPORT
+    if _COLOR_SUPPORT is None:
+        _COLOR_SUPPORT = _supports_color()
+    return _COLOR_SUPPORT
+
+
 def _supports_ansi_sequences(file: TextIO = sys.stdout) -> bool:
-    if platform.system() == "Windows":
+    if _IS_WINDOWS:
         return _enable_windows_vt_mode()
     return hasattr(file, "isatty") and file.isatty()
 
 
+_ANSI_SUB = _ANSI_REGEX.sub
+
+
+def _leading_sgr(text: str) -> str:
+    """Return the run of SGR sequences (``ESC [ digits/; m``) opening *text*."""
+    end = 0
+    while text.startswith("\033[", end):
+        close = text.find("m", end + 2)
+        if close <= end + 2 or text[end + 2 : close].strip("0123456789;"):
+            break
+        end = close + 1
+    return text[:end]
+
+
+@functools.lru_cache(maxsize=32)
+def _get_wrapper(
+    width: int, indent: str, subsequent_indent: str
+) -> textwrap.TextWrapper:
+    """Return a shared TextWrapper; ``fill()`` does not mutate it."""
+    return textwrap.TextWrapper(
+        width=width,
+        initial_indent=indent,
+        subsequent_indent=subsequent_indent,
+        break_long_words=False,
+        break_on_hyphens=False,
+    )
+
+
 def _strip_ansi(text: str) -> str:
-    return _ANSI_REGEX.sub("", text)
+    if "\x1b" not in text:
+        return text
+    return _ANSI_SUB("", text)
 
 
 class TerminalOutputFormatter(OutputFormatter):
@@ -210,9 +263,10 @@ class TerminalOutputFormatter(OutputFormatter):
     def __init__(self, use_colors: bool | None = None) -> None:
         _ensure_colorama_initialized()
         if use_colors is None:
-            use_colors = _supports_color()
+            use_colors = _get_color_support()
         self.use_colors: bool = use_colors
         self._logger: logging.Logger = logging.getLogger("cliframework.output")
+        self._blank_line: str = ""
         self._update_terminal_size()
 
     def format(self, text: str, style: str | None = None) -> str:
@@ -224,6 +278,16 @@ class TerminalOutputFormatter(OutputFormatter):
             return text
         return f"{style_code}{text}{COLORS['reset']}"
 
+    def _style_codes(self, style: str | None) -> tuple[str, str]:
+        """Return the (start, reset) codes ``format()`` wraps text in."""
+        if not self.use_colors or not style:
+            return "", ""
+        style_code = STYLES.get(style, COLORS.get(style, ""))
+        if not style_code:
+            self._logger.warning(f"Unknown style: {style}")
+            return "", ""
+        return style_code, COLORS["reset"]
+
     def style_text(
         self,
         text: str,
@@ -286,39 +350,53 @@ class TerminalOutputFormatter(OutputFormatter):
             min(len(_strip_ansi(h)), max_col_width) for h in headers
         ]
 
+        # Cell text and its ANSI-free form, computed once for sizing and
+        # padding alike.
+        body: list[tuple[list[str], list[str]]] = []
         for row in rows:
-            for i, cell in enumerate(row):
-                if i < len(col_widths):
-                    clean_cell = _strip_ansi(str(cell))
-                    col_widths[i] = min(
-                        max(col_widths[i], len(clean_cell)),
-                        max_col_width,
-                    )
+            cells = [str(cell) for cell in row[:num_cols]]
+            clean_cells = cells
+            joined = "\x01".join(cells)
+            if "\x1b" in joined:
+                # One regex pass per row; the separator cannot take part in
+                # an escape sequence, but cells may contain it themselves.
+                if joined.count("\x01") == len(cells) - 1:
+                    clean_cells = _ANSI_SUB("", joined).split("\x01")
+                else:
+                    clean_cells = [_strip_ansi(cell) for cell in cells]
+            body.append((cells, clean_cells))
 
-        separator = "+" + "+".join("-" * (w + 2) for w in col_widths) + "+"
+        for i in range(num_cols):
+            widest = max(
+                (len(clean[i]) for _, clean in body if i < len(clean)),
+                default=0,
+            )
+            col_widths[i] = min(max(col_widths[i], widest), max_col_width)
 
-        print(separator, file=file)
+        separator = "+" + "+".join("-" * (w + 2) for w in col_widths) + "+"
 
         header_cells = [
             self._pad_cell(h, col_widths[i], truncate=True)
             for i, h in enumerate(headers)
             if i < len(col_widths)
         ]
-        print(
-            self.format("| " + " | ".join(header_cells) + " |", "header"),
-            file=file,
-        )
-        print(separator, file=file)
-
-        for row in rows:
-            cells = [
-                self._pad_cell(str(cell), col_widths[i], truncate=True)
-                for i, cell in enumerate(row)
-                if i < len(col_widths)
+        header_row = "| " + " | ".join(header_cells) + " |"
+        if self.use_colors:
+            header_row = _HEADER_PREFIX + header_row + _RESET
+        lines: list[str] = [separator, header_row, separator]
+
+        pad = self._pad_cell
+        append = lines.append
+        for cells, clean_cells in body:
+            padded = [
+                pad(cell, col_widths[i], True, clean_cells[i])
+                for i, cell in enumerate(cells)
             ]
-            print("| " + " | ".join(cells) + " |", file=file)
+            append("| " + " | ".join(padded) + " |")
 
-        print(separator, file=file)
+        lines.append(separator)
+        lines.append("")
+        file.write("\n".join(lines))
 
     def _render_table_json(
         self,
@@ -406,71 +484,99 @@ class TerminalOutputFormatter(OutputFormatter):
         if suffix and not suffix.startswith(" "):
             suffix = " " + suffix
 
+        full_bar = char * width
+        empty_bar = empty_char * width
+        low_on, low_off = self._style_codes(color_low)
+        mid_on, mid_off = self._style_codes(color_mid)
+        high_on, high_off = self._style_codes(color_high)
+
+        head = prefix + left_bracket
+        low_limit = color_threshold_low * total
+        high_limit = color_threshold_high * total
+        join = "".join
+
         last_visible_len = 0
-        last_render_time = 0.0
+        min_interval_ns = int(min_render_interval * 1_000_000_000)
+        last_render_time = 0
+        last_state: tuple[Any, ...] | None = None
+        write = file.write
+        flush = file.flush
+        strip = _strip_ansi
+        monotonic_ns = time.monotonic_ns
 
         def update(current: int) -> None:
-            nonlocal last_visible_len, last_render_time
+            nonlocal last_visible_len, last_render_time, last_state
             if total <= 0:
                 return
 
-            now = time.monotonic()
+            now = monotonic_ns()
             is_terminal_update = current >= total or current <= 0
             if (
                 not is_terminal_update
-                and now - last_render_time < min_render_interval
+                and now - last_render_time < min_interval_ns
             ):
                 return
-            last_render_time = now
 
-            progress = max(0.0, min(1.0, current / total))
-            filled = int(width * progress)
+            if current <= 0:
+                done = 0
+            elif current >= total:
+                done = total
+            else:
+                done = current
+            filled = int(width * done // total)
 
-            percent_str = f" {progress * 100:5.1f}%" if show_percent else ""
-            count_str = f" {max(0, current)}/{total}" if show_count else ""
+            percent_str = (
+                f" {done / total * 100:5.1f}%" if show_percent else ""
+            )
+            shown_count = max(0, current) if show_count else -1
 
             if self.use_colors:
-                if progress < color_threshold_low:
-                    color = color_low
-                elif progress < color_threshold_high:
-                    color = color_mid
+                if done < low_limit:
+                    color_on, color_off = low_on, low_off
+                elif done < high_limit:
+                    color_on, color_off = mid_on, mid_off
                 else:
-                    color = color_high
-                bar_visible = (
-                    self.format(char * filled, color)
-                    + empty_char * (width - filled)
-                )
+                    color_on, color_off = high_on, high_off
             else:
-                bar_visible = char * filled + empty_char * (width - filled)
+                color_on = color_off = ""
 
-            line = (
-                f"{prefix}{left_bracket}{bar_visible}{right_bracket}"
-                f"{percent_str}{count_str}{suffix}"
+            # Everything the frame shows; an unchanged state is not redrawn.
+            state = (filled, color_on, percent_str, shown_count)
+            if state == last_state and not is_terminal_update:
+                return
+            last_state = state
+            last_render_time = now
+            count_str = f" {shown_count}/{total}" if show_count else ""
+
+            line = join(
+                (
+                    head,
+                    color_on,
+                    full_bar[:filled],
+                    color_off,
+                    empty_bar[filled:],
+                    right_bracket,
+                    percent_str,
+                    count_str,
+                    suffix,
+                )
             )
 
             try:
                 if use_carriage_return:
                     if supports_erase:
-                        print(
-                            f"\r{line}\033[K",
-                            end="",
-                            flush=True,
-                            file=file,
-                        )
+                        out = f"\r{line}\033[K"
                     else:
-                        current_len = len(_strip_ansi(line))
+                        current_len = len(strip(line))
                         pad_spaces = max(0, last_visible_len - current_len)
-                        print(
-                            f"\r{line}{' ' * pad_spaces}",
-                            end="",
-                            flush=True,
-                            file=file,
-                        )
+                        out = f"\r{line}{' ' * pad_spaces}"
                         last_visible_len = current_len
                     if current >= total:
-                        print(file=file, flush=True)
+                        out += "\n"
                 else:
-                    print(line, file=file, flush=True)
+                    out = line + "\n"
+                write(out)
+                flush()
             except UnicodeEncodeError:
                 simple_bar = "#" * filled + "-" * (width - filled)
                 simple_line = (
@@ -492,14 +598,12 @@ class TerminalOutputFormatter(OutputFormatter):
 
     def clear_line(self, file: TextIO = sys.stdout) -> None:
         if _supports_ansi_sequences(file):
-            print("\r\033[K", end="", flush=True, file=file)
+            file.write(_ANSI_CLEAR_LINE)
         else:
-            print(
-                "\r" + " " * self.terminal_width,
-                end="\r",
-                flush=True,
-                file=file,
-            )
+            if len(self._blank_line) != self.terminal_width + 2:
+                self._blank_line = "\r" + " " * self.terminal_width + "\r"
+            file.write(self._blank_line)
+        file.flush()
 
     def wrap_text(
         self,
@@ -511,13 +615,7 @@ class TerminalOutputFormatter(OutputFormatter):
         if width is None:
             width = self.terminal_width
         clean_text = _strip_ansi(text)
-        wrapper = textwrap.TextWrapper(
-            width=width,
-            initial_indent=indent,
-            subsequent_indent=subsequent_indent,
-            break_long_words=False,
-            break_on_hyphens=False,
-        )
+        wrapper = _get_wrapper(width, indent, subsequent_indent)
         return wrapper.fill(clean_text)
 
     def get_terminal_size(self) -> tuple[int, int]:
@@ -533,13 +631,27 @@ class TerminalOutputFormatter(OutputFormatter):
             self.terminal_width = 80
             self.terminal_height = 24
 
-    def _pad_cell(self, text: str, width: int, truncate: bool = True) -> str:
-        clean_text = _strip_ansi(text)
+    def _pad_cell(
+        self,
+        text: str,
+        width: int,
+        truncate: bool = True,
+        clean_text: str | None = None,
+    ) -> str:
+        if clean_text is None:
+            if "\x1b" not in text:
+                clean_text = text
+            else:
+                clean_text = _ANSI_SUB("", text)
+        if clean_text is text:
+            if truncate and len(text) > width:
+                return text[: width - 3] + "..."
+            return text.ljust(width)
+
         clean_len = len(clean_text)
 
         if truncate and clean_len > width:
-            match = _ANSI_PREFIX_REGEX.match(text)
-            ansi_prefix = match.group(0) if match else ""
+            ansi_prefix = _leading_sgr(text)
             truncated = clean_text[: width - 3] + "..."
             if ansi_prefix:
                 return ansi_prefix + truncated + COLORS["reset"]
@@ -567,6 +679,37 @@ def _get_default_formatter() -> TerminalOutputFormatter:
         return _default_formatter
 
 
+class _EchoBatch(threading.local):
+    file: TextIO | None = None
+    parts: list[str] | None = None
+
+
+_echo_batch = _EchoBatch()
+
+
+@contextlib.contextmanager
+def echo_batch(file: TextIO = sys.stdout) -> Iterator[None]:
+    """Collect this thread's ``echo()`` output to *file* and write it once.
+
+    The buffered text is written and flushed when the block exits, including
+    on error. Nested batches join the outermost one.
+    """
+    if _echo_batch.file is not None:
+        yield
+        return
+    parts: list[str] = []
+    _echo_batch.file = file
+    _echo_batch.parts = parts
+    try:
+        yield
+    finally:
+        _echo_batch.file = None
+        _echo_batch.parts = None
+        if parts:
+            file.write("".join(parts))
+            file.flush()
+
+
 def echo(
     text: str,
     style: str | None = None,
@@ -575,7 +718,13 @@ def echo(
 ) -> None:
     if formatter is None:
         formatter = _get_default_formatter()
-    print(formatter.format(text, style), file=file)
+    if style and formatter.use_colors:
+        text = formatter.format(text, style)
+    parts = _echo_batch.parts
+    if parts is not None and _echo_batch.file is file:
+        parts.append(f"{text}\n")
+        return
+    file.write(f"{text}\n")
 
 
 def style(
@@ -652,6 +801,7 @@ __all__ = [
     "OutputError",
     "TerminalOutputFormatter",
     "echo",
+    "echo_batch",
     "style",
     "progress_bar",
     "table",
@@ -13,7 +13,7 @@ This example shows how to use:
 
 import asyncio
 import time
-from cli import CLI, echo
+from cli import CLI, echo, echo_batch, progress_bar, style, table
 
 cli = CLI(
     name='example-app',
@@ -34,8 +34,9 @@ def hello_command(name: str, count: int = 1, uppercase: bool = False) -> int:
     if uppercase:
         greeting = greeting.upper()
 
-    for i in range(count):
-        echo(greeting, 'success')
+    with echo_batch():
+        for i in range(count):
+            echo(greeting, 'success')
 
     return 0
 
@@ -53,61 +54,67 @@ async def fetch_command(url: str, timeout: int = 30) -> int:
     return 0
 
 
+async def _simulate_progress(steps: int, delay: float, **bar_options) -> None:
+    """Advance a progress bar by one step per simulated unit of work"""
+    update = progress_bar(steps, **bar_options)
+    for i in range(steps):
+        await asyncio.sleep(delay)
+        update(i + 1)
+
+
+_DOWNLOAD_STYLES = {
+    'default': {
+        'prefix': 'Download:',
+        'suffix': 'complete'
+    },
+    'fancy': {
+        'char': '▓',
+        'empty_char': '░',
+        'suffix': 'done',
+        'color_low': 'red',
+        'color_mid': 'yellow',
+        'color_high': 'green'
+    },
+    'minimal': {
+        'char': '=',
+        'empty_char': ' ',
+        'brackets': ('', ''),
+        'prefix': 'Progress:',
+        'show_count': False
+    },
+    'dots': {
+        'char': '●',
+        'empty_char': '○',
+        'brackets': ('(', ')'),
+        'prefix': 'Loading:',
+        'color_low': 'blue',
+        'color_mid': 'cyan',
+        'color_high': 'green'
+    },
+    'classic': {
+        'char': '#',
+        'empty_char': '-',
+        'brackets': ('|', '|'),
+        'prefix': 'Downloading:',
+        'width': 40
+    }
+}
+
+_DEFAULT_DOWNLOAD_STYLE = _DOWNLOAD_STYLES['default']
+
+
 @cli.command(name='download')
 @cli.argument('url', help='URL to download', type=str)
 @cli.option('--size', '-s', type=int, default=100, help='Simulated download size')
 @cli.option('--style', help='Progress bar style', default='default')
 async def download_command(url: str, size: int = 100, style: str = 'default') -> int:
     """Download file with customizable progress bar"""
-    from cli import progress_bar
-
     echo(f"Downloading {url}...", 'info')
 
-    styles = {
-        'default': {
-            'prefix': 'Download:',
-            'suffix': 'complete'
-        },
-        'fancy': {
-            'char': '▓',
-            'empty_char': '░',
-            'prefix': f'{url}:',
-            'suffix': 'done',
-            'color_low': 'red',
-            'color_mid': 'yellow',
-            'color_high': 'green'
-        },
-        'minimal': {
-            'char': '=',
-            'empty_char': ' ',
-            'brackets': ('', ''),
-            'prefix': 'Progress:',
-            'show_count': False
-        },
-        'dots': {
-            'char': '●',
-            'empty_char': '○',
-            'brackets': ('(', ')'),
-            'prefix': 'Loading:',
-            'color_low': 'blue',
-            'color_mid': 'cyan',
-            'color_high': 'green'
-        },
-        'classic': {
-            'char': '#',
-            'empty_char': '-',
-            'brackets': ('|', '|'),
-            'prefix': 'Downloading:',
-            'width': 40
-        }
-    }
-
-    style_config = styles.get(style, styles['default'])
-    update = progress_bar(size, **style_config)
-
-    for i in range(size):
-        await asyncio.sleep(0.03)
-        update(i + 1)
+    style_config = _DOWNLOAD_STYLES.get(style, _DEFAULT_DOWNLOAD_STYLE)
+    if style == 'fancy':
+        style_config = {**style_config, 'prefix': f'{url}:'}
+    await _simulate_progress(size, 0.03, **style_config)
 
     echo(f"Downloaded {url} successfully!", 'success')
     return 0
@@ -118,12 +125,11 @@ async def download_command(url: str, size: int = 100, style: str = 'default') ->
 @cli.option('--chunks', '-c', type=int, default=50, help='Number of chunks')
 async def upload_command(filename: str, chunks: int = 50) -> int:
     """Upload file with arrow-style progress bar"""
-    from cli import progress_bar
-
     echo(f"Uploading {filename}...", 'info')
 
-    update = progress_bar(
+    await _simulate_progress(
         chunks,
+        0.04,
         char='▶',
         empty_char='▷',
         brackets=('⟨', '⟩'),
@@ -136,10 +142,6 @@ async def upload_command(filename: str, chunks: int = 50) -> int:
         color_threshold_high=0.7
     )
 
-    for i in range(chunks):
-        await asyncio.sleep(0.04)
-        update(i + 1)
-
     echo(f"Upload complete!", 'success')
     return 0
 
@@ -149,12 +151,11 @@ async def upload_command(filename: str, chunks: int = 50) -> int:
 @cli.option('--steps', type=int, default=75, help='Installation steps')
 async def install_command(package: str, steps: int = 75) -> int:
     """Install package with gradient-style progress bar"""
-    from cli import progress_bar
-
     echo(f"Installing {package}...", 'info')
 
-    update = progress_bar(
+    await _simulate_progress(
         steps,
+        0.02,
         char='━',
         empty_char='─',
         brackets=('┃', '┃'),
@@ -166,10 +167,6 @@ async def install_command(package: str, steps: int = 75) -> int:
         width=50
     )
 
-    for i in range(steps):
-        await asyncio.sleep(0.02)
-        update(i + 1)
-
     echo(f"Package {package} installed successfully!", 'success')
     return 0
 
@@ -179,12 +176,11 @@ async def install_command(package: str, steps: int = 75) -> int:
 @cli.option('--stages', type=int, default=60, help='Build stages')
 async def build_command(project: str, stages: int = 60) -> int:
     """Build project with square-style progress bar"""
-    from cli import progress_bar
-
     echo(f"Building {project}...", 'info')
 
-    update = progress_bar(
+    await _simulate_progress(
         stages,
+        0.03,
         char='■',
         empty_char='□',
         brackets=('⟦', '⟧'),
@@ -197,10 +193,6 @@ async def build_command(project: str, stages: int = 60) -> int:
         color_threshold_high=0.80
     )
 
-    for i in range(stages):
-        await asyncio.sleep(0.03)
-        update(i + 1)
-
     echo(f"Build complete!", 'success')
     return 0
 
@@ -211,12 +203,11 @@ async def build_command(project: str, stages: int = 60) -> int:
 @cli.option('--files', type=int, default=40, help='Number of files')
 async def sync_command(source: str, dest: str, files: int = 40) -> int:
     """Sync directories with compact progress bar"""
-    from cli import progress_bar
-
     echo(f"Syncing {source} → {dest}...", 'info')
 
-    update = progress_bar(
+    await _simulate_progress(
         files,
+        0.05,
         char='█',
         empty_char='░',
         prefix=f'{source}→{dest}:',
@@ -228,10 +219,6 @@ async def sync_command(source: str, dest: str, files: int = 40) -> int:
         color_high='bright_blue'
     )
 
-    for i in range(files):
-        await asyncio.sleep(0.05)
-        update(i + 1)
-
     echo(f"Sync complete!", 'success')
     return 0
 
@@ -241,13 +228,10 @@ async def sync_command(source: str, dest: str, files: int = 40) -> int:
 @cli.option('--no-colors', is_flag=True, help='Disable colors')
 async def benchmark_command(iterations: int = 100, no_colors: bool = False) -> int:
     """Run benchmark with performance-focused progress bar"""
-    from cli import progress_bar
-
     echo(f"Running benchmark with {iterations} iterations...", 'info')
 
     if no_colors:
-        update = progress_bar(
-            iterations,
+        bar_options = dict(
             char='#',
             empty_char='-',
             brackets=('[', ']'),
@@ -256,8 +240,7 @@ async def benchmark_command(iterations: int = 100, no_colors: bool = False) -> i
             width=40
         )
     else:
-        update = progress_bar(
-            iterations,
+        bar_options = dict(
             char='▰',
             empty_char='▱',
             prefix='Benchmark:',
@@ -269,96 +252,93 @@ async def benchmark_command(iterations: int = 100, no_colors: bool = False) -> i
             color_threshold_high=0.8
         )
 
-    for i in range(iterations):
-        await asyncio.sleep(0.01)
-        update(i + 1)
+    await _simulate_progress(iterations, 0.01, **bar_options)
 
     echo(f"Benchmark complete! Average: {iterations / 10:.1f} ops/sec", 'success')
     return 0
 
 
+_PROGRESS_DEMOS = [
+    {
+        'name': 'Default Style',
+        'config': {'prefix': 'Default:', 'width': 30}
+    },
+    {
+        'name': 'Blocks',
+        'config': {
+            'char': '▓',
+            'empty_char': '░',
+            'prefix': 'Blocks:',
+            'width': 30,
+            'color_low': 'red',
+            'color_high': 'green'
+        }
+    },
+    {
+        'name': 'Arrows',
+        'config': {
+            'char': '▶',
+            'empty_char': '▷',
+            'brackets': ('⟨', '⟩'),
+            'prefix': 'Arrows:',
+            'width': 30
+        }
+    },
+    {
+        'name': 'Dots',
+        'config': {
+            'char': '●',
+            'empty_char': '○',
+            'brackets': ('(', ')'),
+            'prefix': 'Dots:',
+            'width': 30
+        }
+    },
+    {
+        'name': 'ASCII',
+        'config': {
+            'char': '#',
+            'empty_char': '-',
+            'brackets': ('|', '|'),
+            'prefix': 'ASCII:',
+            'width': 30
+        }
+    },
+    {
+        'name': 'Lines',
+        'config': {
+            'char': '━',
+            'empty_char': '─',
+            'brackets': ('┃', '┃'),
+            'prefix': 'Lines:',
+            'width': 30
+        }
+    },
+    {
+        'name': 'Minimal',
+        'config': {
+            'char': '=',
+            'empty_char': ' ',
+            'brackets': ('', ''),
+            'prefix': 'Minimal:',
+            'width': 30,
+            'show_count': False
+        }
+    }
+]
+
+
 @cli.command(name='progress-demo')
 async def progress_demo_command() -> int:
     """Demonstrate all progress bar styles"""
-    from cli import progress_bar
-
     echo("=== Progress Bar Styles Demo ===", 'header')
     print()
 
-    demos = [
-        {
-            'name': 'Default Style',
-            'config': {'prefix': 'Default:', 'width': 30}
-        },
-        {
-            'name': 'Blocks',
-            'config': {
-                'char': '▓',
-                'empty_char': '░',
-                'prefix': 'Blocks:',
-                'width': 30,
-                'color_low': 'red',
-                'color_high': 'green'
-            }
-        },
-        {
-            'name': 'Arrows',
-            'config': {
-                'char': '▶',
-                'empty_char': '▷',
-                'brackets': ('⟨', '⟩'),
-                'prefix': 'Arrows:',
-                'width': 30
-            }
-        },
-        {
-            'name': 'Dots',
-            'config': {
-                'char': '●',
-                'empty_char': '○',
-                'brackets': ('(', ')'),
-                'prefix': 'Dots:',
-                'width': 30
-            }
-        },
-        {
-            'name': 'ASCII',
-            'config': {
-                'char': '#',
-                'empty_char': '-',
-                'brackets': ('|', '|'),
-                'prefix': 'ASCII:',
-                'width': 30
-            }
-        },
-        {
-            'name': 'Lines',
-            'config': {
-                'char': '━',
-                'empty_char': '─',
-                'brackets': ('┃', '┃'),
-                'prefix': 'Lines:',
-                'width': 30
-            }
-        },
-        {
-            'name': 'Minimal',
-            'config': {
-                'char': '=',
-                'empty_char': ' ',
-                'brackets': ('', ''),
-                'prefix': 'Minimal:',
-                'width': 30,
-                'show_count': False
-            }
-        }
-    ]
-
-    for demo in demos:
+    for demo in _PROGRESS_DEMOS:
         echo(f"{demo['name']}:", 'info')
         update = progress_bar(50, **demo['config'])
-        for i in range(51):
-            await asyncio.sleep(0.02)
+        for i in range(0, 51, 5):
+            await asyncio.sleep(0.1)
             update(i)
         print()
 
@@ -366,15 +346,24 @@ async def progress_demo_command() -> int:
     return 0
 
 
+_DB_STATUS_HEADERS = ("Component", "Status", "Details")
+_DB_STATUS_ROWS = (
+    ("Connection", "OK", "localhost:5432"),
+    ("Auth", "OK", "user: admin"),
+    ("Tables", "OK", "42 tables"),
+    ("Size", "OK", "1.2 GB"),
+)
+
+
 @cli.group(name='database', help='Database operations')
 class DatabaseCommands:
     """Group of database-related commands"""
 
     @cli.command()
-    def init(self) -> int:
+    async def init(self) -> int:
         """Initialize database"""
         echo("Initializing database...", 'info')
-        time.sleep(1)
+        await asyncio.sleep(1)
         echo("Database initialized successfully", 'success')
         return 0
 
@@ -394,30 +383,19 @@ class DatabaseCommands:
     @cli.command()
     def status(self) -> int:
         """Show database status"""
-        from cli import table
-
         echo("Database Status:", 'header')
-
-        headers = ["Component", "Status", "Details"]
-        rows = [
-            ["Connection", "OK", "localhost:5432"],
-            ["Auth", "OK", "user: admin"],
-            ["Tables", "OK", "42 tables"],
-            ["Size", "OK", "1.2 GB"]
-        ]
-
-        table(headers, rows)
+        table(_DB_STATUS_HEADERS, _DB_STATUS_ROWS)
         return 0
 
 
 async def timing_middleware(next_handler):
     """Middleware that times command execution"""
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     echo("[Timing] Command started", 'debug')
     result = await next_handler()
 
-    elapsed = time.time() - start_time
+    elapsed = time.perf_counter() - start_time
     echo(f"[Timing] Command completed in {elapsed:.2f}s", 'debug')
 
     return result
@@ -449,71 +427,70 @@ def cleanup_handler():
 cli.add_cleanup_callback(cleanup_handler)
 
 
-@cli.command(name='demo')
-def demo_command() -> int:
-    """Run demonstration of all features"""
-    from cli import style, table, progress_bar
-    import time
+_DEMO_FEATURE_HEADERS = ("Feature", "Status", "Notes")
+_DEMO_FEATURE_ROWS = (
+    ("Async Support", "✓", "Full asyncio support"),
+    ("Middleware", "✓", "Chainable middleware"),
+    ("Type Safety", "✓", "Runtime validation"),
+    ("Graceful Shutdown", "✓", "Signal handling"),
+)
 
-    echo("=== CLI Framework Demo ===", 'header')
-    print()
+_DEMO_EXAMPLES = (
+    "hello Alice --count=3",
+    "download https://example.com --style=fancy",
+    "upload myfile.zip --chunks=30",
+    "install numpy --steps=50",
+    "build myproject",
+    "sync /source /dest --files=25",
+    "benchmark --iterations=80",
+    "progress-demo",
+    "database.status",
+)
 
-    echo("1. Styled Text:", 'info')
-    echo("   " + style("Success", fg='green', bold=True))
-    echo("   " + style("Warning", fg='yellow', bold=True))
-    echo("   " + style("Error", fg='red', bold=True))
-    print()
 
-    echo("2. Tables:", 'info')
-    headers = ["Feature", "Status", "Notes"]
-    rows = [
-        ["Async Support", "✓", "Full asyncio support"],
-        ["Middleware", "✓", "Chainable middleware"],
-        ["Type Safety", "✓", "Runtime validation"],
-        ["Graceful Shutdown", "✓", "Signal handling"]
-    ]
-    table(headers, rows)
+@cli.command(name='demo')
+def demo_command() -> int:
+    """Run demonstration of all features"""
+    with echo_batch():
+        echo("=== CLI Framework Demo ===", 'header')
+        echo("")
+
+        echo("1. Styled Text:", 'info')
+        echo("   " + style("Success", fg='green', bold=True))
+        echo("   " + style("Warning", fg='yellow', bold=True))
+        echo("   " + style("Error", fg='red', bold=True))
+        echo("")
+
+        echo("2. Tables:", 'info')
+    table(_DEMO_FEATURE_HEADERS, _DEMO_FEATURE_ROWS)
     print()
 
     echo("3. Progress Bars:", 'info')
 
     echo("   Default style:")
     update = progress_bar(50, prefix="Default:", width=30)
-    for i in range(51):
+    for i in range(0, 51, 5):
         update(i)
-        time.sleep(0.02)
+        time.sleep(0.1)
 
     echo("   Block style:")
     update = progress_bar(50, char='▓', empty_char='░', prefix="Blocks:", width=30,
                           color_low='red', color_mid='yellow', color_high='green')
-    for i in range(51):
+    for i in range(0, 51, 5):
         update(i)
-        time.sleep(0.02)
+        time.sleep(0.1)
 
     echo("   Custom brackets:")
     update = progress_bar(50, char='>', empty_char='-', brackets=('|', '|'),
                           prefix="Custom:", width=30)
-    for i in range(51):
+    for i in range(0, 51, 5):
         update(i)
-        time.sleep(0.02)
+        time.sleep(0.1)
 
     print()
 
     echo("4. Try these commands:", 'info')
-    examples = [
-        "hello Alice --count=3",
-        "download https://example.com --style=fancy",
-        "upload myfile.zip --chunks=30",
-        "install numpy --steps=50",
-        "build myproject",
-        "sync /source /dest --files=25",
-        "benchmark --iterations=80",
-        "progress-demo",
-        "database.status",
-    ]
-
-    for example in examples:
-        echo(f"   {example}", 'code')
+    echo("\n".join(f"   {example}" for example in _DEMO_EXAMPLES), 'code')
 
     print()
     echo("Press Ctrl+C to test graceful shutdown", 'warning')
@@ -524,5 +501,13 @@ def demo_command() -> int:
 if __name__ == '__main__':
     import sys
 
+    # Optional: a libuv-based event loop for the async commands.
+    try:
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
     exit_code = cli.run()
     sys.exit(exit_code)
\ No newline at end of file